@@ -0,0 +1,231 @@
+'''
+Optional Numba-accelerated decode path.
+
+Importing this module requires numba and numpy (pip install bencode[fast]).
+decoder.py imports it inside try/except ImportError, so the pure-Python
+implementation keeps working when they are not installed.
+
+The work is split in two:
+    * tokenize() - a JIT-compiled scan over the raw byte buffer that emits
+      (kind, start, end) token rows into a preallocated int64 array. This
+      is a tight loop over uint8 data, which is exactly what Numba
+      compiles well, and it runs without holding the GIL.
+    * _materialize() - a plain-Python linear pass that builds the int,
+      bytes, list and dict objects from the tokens, using an explicit
+      stack instead of recursion.
+
+Malformed input makes decode() return INVALID instead of raising; the
+caller falls back to the pure-Python decoder, which raises the documented
+exceptions with the right positions.
+'''
+
+import numpy as np
+from numba import njit
+
+# Token kinds emitted by tokenize(). _KIND_INT carries (start, end) of the
+# digits for Python-side parsing; _KIND_INTVAL carries the already-parsed
+# value in the start column.
+_KIND_INT = 1
+_KIND_STR = 2
+_KIND_LIST = 3
+_KIND_DICT = 4
+_KIND_END = 5
+_KIND_INTVAL = 6
+
+# parse_int status codes.
+_INT_OK = 0
+_INT_INVALID = 1
+_INT_TOO_LONG = 2
+
+# Below this input size the tokenizer call overhead outweighs the win.
+MIN_FAST_SIZE = 1024
+
+# Initial scratch rows for tokenize(). Real payloads produce far fewer
+# tokens than bytes, so start small and retry once with the worst-case
+# bound (one token per input byte) instead of always allocating 24 bytes
+# of scratch per input byte.
+_SCRATCH_ROWS = 1 << 16
+
+# Sentinel returned by decode() when the fast path cannot handle the input.
+INVALID = object()
+
+@njit(cache=True, nogil=True)
+def parse_int(buf, start, end):
+    '''
+Parses the ASCII decimal in buf[start:end] using plain int64 arithmetic -
+no slice, no Python int construction. Returns (value, status): _INT_OK,
+_INT_INVALID for unexpected bytes, or _INT_TOO_LONG for spans that could
+overflow int64 (the caller falls back to Python's int() for those).
+    '''
+    i = start
+    neg = False
+    if i < end and buf[i] == 0x2d:  # '-'
+        neg = True
+        i += 1
+    if i >= end:
+        return 0, _INT_INVALID
+    if end - i > 18:
+        return 0, _INT_TOO_LONG
+    n = 0
+    while i < end:
+        byte = buf[i]
+        if byte < 0x30 or byte > 0x39:
+            return 0, _INT_INVALID
+        n = n * 10 + (byte - 0x30)
+        i += 1
+    if neg:
+        return -n, _INT_OK
+    return n, _INT_OK
+
+@njit(cache=True, nogil=True)
+def tokenize(buf, out):
+    '''
+Scans buf (uint8 array) and writes token rows [kind, start, end] into out.
+Returns the number of tokens, -1 if the input is malformed, or -2 if out
+ran out of rows (the caller retries with a bigger scratch array).
+    '''
+    n = buf.shape[0]
+    rows = out.shape[0]
+    pos = 0
+    count = 0
+    depth = 0
+    while pos < n:
+        if count >= rows:
+            return -2
+        byte = buf[pos]
+        if byte == 0x69:  # 'i'
+            start = pos + 1
+            pos = start
+            while pos < n and buf[pos] != 0x65:  # 'e'
+                pos += 1
+            if pos >= n:
+                return -1
+            value, status = parse_int(buf, start, pos)
+            if status == _INT_OK:
+                out[count, 0] = _KIND_INTVAL
+                out[count, 1] = value
+                out[count, 2] = 0
+            elif status == _INT_TOO_LONG:
+                out[count, 0] = _KIND_INT
+                out[count, 1] = start
+                out[count, 2] = pos
+            else:
+                return -1
+            count += 1
+            pos += 1
+        elif 0x30 <= byte <= 0x39:  # '0'..'9'
+            length = 0
+            while pos < n and 0x30 <= buf[pos] <= 0x39:
+                length = length * 10 + (buf[pos] - 0x30)
+                # No string can be longer than the buffer; rejecting here
+                # also keeps a ~20-digit prefix from wrapping int64 (these
+                # loops run with bounds checking off under numba).
+                if length > n:
+                    return -1
+                pos += 1
+            if pos >= n or buf[pos] != 0x3a:  # ':'
+                return -1
+            start = pos + 1
+            if length > n - start:
+                return -1
+            end = start + length
+            out[count, 0] = _KIND_STR
+            out[count, 1] = start
+            out[count, 2] = end
+            count += 1
+            pos = end
+        elif byte == 0x6c:  # 'l'
+            out[count, 0] = _KIND_LIST
+            out[count, 1] = pos
+            out[count, 2] = pos
+            count += 1
+            depth += 1
+            pos += 1
+        elif byte == 0x64:  # 'd'
+            out[count, 0] = _KIND_DICT
+            out[count, 1] = pos
+            out[count, 2] = pos
+            count += 1
+            depth += 1
+            pos += 1
+        elif byte == 0x65:  # 'e'
+            if depth == 0:
+                return -1
+            out[count, 0] = _KIND_END
+            out[count, 1] = pos
+            out[count, 2] = pos
+            count += 1
+            depth -= 1
+            pos += 1
+        else:
+            return -1
+        if depth == 0:
+            # One complete top-level value; ignore trailing bytes like the
+            # pure-Python decoder does.
+            break
+    if depth != 0:
+        return -1
+    return count
+
+def _materialize(data, tokens, count):
+    '''
+Builds Python objects from the token rows in one linear pass. Returns the
+decoded top-level value, or INVALID if the token stream cannot form valid
+bencode (e.g. a non-string dictionary key).
+    '''
+    root = []
+    stack = [root]
+    kind_stack = [_KIND_LIST]
+    for index in range(count):
+        kind = tokens[index, 0]
+        if kind == _KIND_STR:
+            stack[-1].append(data[tokens[index, 1]:tokens[index, 2]])
+        elif kind == _KIND_INTVAL:
+            stack[-1].append(int(tokens[index, 1]))
+        elif kind == _KIND_INT:
+            try:
+                stack[-1].append(int(data[tokens[index, 1]:tokens[index, 2]]))
+            except ValueError:
+                return INVALID
+        elif kind == _KIND_END:
+            items = stack.pop()
+            kind = kind_stack.pop()
+            if kind == _KIND_DICT:
+                if len(items) % 2 != 0:
+                    return INVALID
+                keys = items[::2]
+                for key in keys:
+                    if type(key) is not bytes:
+                        return INVALID
+                stack[-1].append(dict(zip(keys, items[1::2])))
+            else:
+                stack[-1].append(items)
+        else:
+            # _KIND_LIST and _KIND_DICT both open a plain list frame; the
+            # finished container is appended to its parent at _KIND_END.
+            stack.append([])
+            kind_stack.append(kind)
+    if len(root) != 1 or len(stack) != 1:
+        return INVALID
+    return root[0]
+
+def decode(data: bytes):
+    '''
+Fast decode of a complete bencode value from position 0. Returns the
+decoded object, or INVALID when the input is malformed or otherwise not
+handled, in which case the caller should use the pure-Python decoder.
+    '''
+    buf = np.frombuffer(data, dtype=np.uint8)
+    n = len(data)
+    # Every token consumes at least one input byte, so n rows is the
+    # worst-case bound; only pathological inputs (e.g. all 'le' pairs)
+    # overflow the small first attempt and pay for the full allocation.
+    rows = n if n < _SCRATCH_ROWS else _SCRATCH_ROWS
+    scratch = np.empty((rows, 3), dtype=np.int64)
+    count = tokenize(buf, scratch)
+    if count == -2 and rows < n:
+        scratch = np.empty((n, 3), dtype=np.int64)
+        count = tokenize(buf, scratch)
+    if count < 0:
+        return INVALID
+    return _materialize(data, scratch, count)
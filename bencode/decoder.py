@@ -1,7 +1,187 @@
 from typing import Optional, Tuple, Union
 from . import exceptions
 
+try:
+    from . import _cbencode
+except ImportError:
+    _cbencode = None
+
+try:
+    from . import _fast
+except ImportError:
+    _fast = None
+
+# Byte constants hoisted to module scope so the hot loops do a single
+# LOAD_GLOBAL instead of re-evaluating ord() on every element.
+_I = ord('i')
+_E = ord('e')
+_L = ord('l')
+_D = ord('d')
+_0 = ord('0')
+_9 = ord('9')
+_MINUS = ord('-')
+
+def _latin1(data: str, exception) -> bytes:
+    '''
+Coerces str input to the bytes it represents, raising the calling
+method's documented exception type for code points above 255 that
+latin-1 cannot map, instead of a bare UnicodeEncodeError.
+    '''
+    try:
+        return data.encode('latin-1')
+    except UnicodeEncodeError as error:
+        raise exception(f'Expected str with code points <= 255, got {error.object[error.start]!r} at index {error.start}') from error
+
+# The decoder holds no state, so the working code lives in module-level
+# functions: calls between them resolve through a plain global name with
+# no attribute lookup or bound-method allocation per call. The Decoder
+# class below is a thin facade that validates and coerces input, then
+# delegates here.
+
+def _decode_integer(data: bytes, pos: int) -> Tuple[int, int]:
+    '''
+Internal variant of Decoder.decode_integer. Assumes data is bytes.
+    '''
+    if data[pos] != _I:
+        raise exceptions.DecodeIntegerError(f'Start of integer not found, at position {pos}')
+    # Fast path: accumulate short runs of ASCII digits in place, which
+    # avoids allocating an intermediate slice. Bencode integers are
+    # overwhelmingly short; past a few digits the slice + int() path is
+    # faster, so anything unusual falls through to it below.
+    i = pos + 1
+    try:
+        byte = data[i]
+        if byte == _MINUS:
+            i += 1
+            byte = data[i]
+        n = 0
+        limit = i + 5
+        while _0 <= byte <= _9 and i < limit:
+            n = n * 10 + (byte - _0)
+            i += 1
+            byte = data[i]
+        if byte == _E and _0 <= data[i-1] <= _9:
+            return (-n if data[pos+1] == _MINUS else n), i
+    except IndexError:
+        pass
+    end = data.find(b'e', pos)
+    if end == -1:
+        raise exceptions.DecodeIntegerError(f'End of integer not found, from position {pos}')
+    try:
+        integer = int(data[pos+1:end])
+    except ValueError:
+        raise exceptions.DecodeIntegerError(f'Invalid integer, from position {pos}')
+    return integer, end
+
+def _decode_string(data: bytes, pos: int) -> Tuple[bytes, int]:
+    '''
+Internal variant of Decoder.decode_string. Assumes data is bytes.
+    '''
+    # bytes.find is memchr under the hood, far faster than any
+    # Python-level scan for the delimiter.
+    colon_index = data.find(b':', pos)
+    if colon_index == -1:
+        raise exceptions.DecodeStringError(f'Colon of string not found, from position {pos}')
+    try:
+        length = int(data[pos:colon_index])
+    except ValueError:
+        raise exceptions.DecodeStringError(f'Invalid length of string, from position {pos}')
+    end = colon_index+1 + length
+    string = data[colon_index+1:end]
+    if len(string) < length:
+        raise exceptions.DecodeStringError(f'Expected string length {length}, got {len(string)}, from position {pos}')
+    return string, end-1
+
+def _decode_value(data: bytes, pos: int) -> Tuple[Union[bytes, int, list, dict], int]:
+    '''
+Decodes one value of any type starting at pos, using an explicit stack of
+open containers instead of recursion: no Python call per nested list or
+dict, and no RecursionError on deeply nested input. Assumes data is
+bytes and that data[pos] can start a value.
+    '''
+    decode_integer = _decode_integer
+    decode_string = _decode_string
+    length = len(data)
+    # One frame per open container: [kind, container, start_pos, key].
+    # key is the pending dictionary key, or None while expecting one.
+    stack = []
+    current_pos = pos
+    while True:
+        if current_pos >= length:
+            kind, _, start, _ = stack[-1]
+            if kind == _L:
+                raise exceptions.DecodeListError(f'End of list not found, from position {start}')
+            raise exceptions.DecodeDictionaryError(f'End of dictionary not found, from position {start}')
+        byte = data[current_pos]
+        if stack and stack[-1][0] == _D and stack[-1][3] is None and byte != _E:
+            key, end = decode_string(data, current_pos)
+            stack[-1][3] = key
+            current_pos = end + 1
+            continue
+        if _0 <= byte <= _9:
+            value, end = decode_string(data, current_pos)
+        elif byte == _I:
+            value, end = decode_integer(data, current_pos)
+        elif byte == _L:
+            stack.append([_L, [], current_pos, None])
+            current_pos += 1
+            continue
+        elif byte == _D:
+            stack.append([_D, {}, current_pos, None])
+            current_pos += 1
+            continue
+        elif byte == _E and stack:
+            frame = stack.pop()
+            if frame[0] == _D and frame[3] is not None:
+                raise exceptions.DecodeDictionaryError(f'Invalid dictionary value, at position {current_pos}')
+            value, end = frame[1], current_pos
+        elif stack and stack[-1][0] == _D:
+            raise exceptions.DecodeDictionaryError(f'Invalid dictionary value, at position {current_pos}')
+        else:
+            raise exceptions.DecodeListError(f'Invalid data type in list, at position {current_pos}')
+        if not stack:
+            return value, end
+        frame = stack[-1]
+        if frame[0] == _L:
+            frame[1].append(value)
+        else:
+            frame[1][frame[3]] = value
+            frame[3] = None
+        current_pos = end + 1
+
+def _decode_list(data: bytes, pos: int) -> Tuple[list, int]:
+    '''
+Internal variant of Decoder.decode_list. Assumes data is bytes.
+    '''
+    if data[pos] != _L:
+        raise exceptions.DecodeListError(f'Start of list not found, at position {pos}')
+    return _decode_value(data, pos)
+
+def _decode_dictionary(data: bytes, pos: int) -> Tuple[dict, int]:
+    '''
+Internal variant of Decoder.decode_dictionary. Assumes data is bytes.
+    '''
+    if data[pos] != _D:
+        raise exceptions.DecodeListError(f'Start of dictionary not found, at position {pos}')
+    return _decode_value(data, pos)
+
+# First-byte dispatch table with one entry per possible byte value, so
+# classifying an element is a single C-level list index instead of a
+# hash lookup or an if-chain of range and equality checks. Bytes that
+# cannot start a value stay None.
+_DISPATCH = [None] * 256
+_DISPATCH[_I] = _decode_integer
+_DISPATCH[_L] = _decode_list
+_DISPATCH[_D] = _decode_dictionary
+for _digit in range(_0, _9 + 1):
+    _DISPATCH[_digit] = _decode_string
+del _digit
+
 class Decoder:
+    # Stateless facade: no instance dict needed, so instances stay one
+    # small allocation and attribute lookups skip the __dict__ probe.
+    __slots__ = ()
+
     def __init__(self) -> None:
         '''
 Decodes Bencode representations of int, str, list, and dict objects to their Python representations.
@@ -29,18 +209,9 @@ Decodes bencode integer to python integer.
     Returns a tuple of python integer and ending index of integer in the data.
         '''
         if not isinstance(data, (bytes, str)):
-            raise DecodeIntegerError(f'Expected bytes or str, got {type(data)}')
-        data = data.encode() if isinstance(data, str) else data
-        if data[pos] != ord('i'):
-            raise exceptions.DecodeIntegerError(f'Start of integer not found, at position {pos}')
-        end = data.find(b'e', pos)
-        if end == -1:
-            raise exceptions.DecodeIntegerError(f'End of integer not found, from position {pos}')
-        try:
-            integer = int(data[pos+1:end])
-        except ValueError:
-            raise exceptions.DecodeIntegerError(f'Invalid integer, from position {pos}')
-        return integer, end
+            raise exceptions.DecodeIntegerError(f'Expected bytes or str, got {type(data)}')
+        data = _latin1(data, exceptions.DecodeIntegerError) if isinstance(data, str) else data
+        return _decode_integer(data, pos)
 
     def decode_string(self, data: Union[bytes, str], pos: Optional[int] = 0) -> Tuple[bytes, int]:
         '''
@@ -63,20 +234,9 @@ Decodes bencode string to python bytes of string.
     Returns a tuple of python bytes of string and ending index of string in the data.
         '''
         if not isinstance(data, (bytes, str)):
-            raise DecodeStringError(f'Expected bytes or str, got {type(data)}')
-        data = data.encode() if isinstance(data, str) else data
-        colon_index = data.find(b':', pos)
-        if colon_index == -1:
-            raise exceptions.DecodeStringError(f'Colon of string not found, from position {pos}')
-        try:
-            length = int(data[pos:colon_index])
-        except ValueError:
-            raise exceptions.DecodeStringError(f'Invalid length of string, from position {pos}')
-        end = colon_index+1 + length
-        string = data[colon_index+1:end]
-        if len(string) < length:
-            raise exceptions.DecodeStringError(f'Expected string length {length}, got {len(string)}, from position {pos}')
-        return string, end-1
+            raise exceptions.DecodeStringError(f'Expected bytes or str, got {type(data)}')
+        data = _latin1(data, exceptions.DecodeStringError) if isinstance(data, str) else data
+        return _decode_string(data, pos)
 
     def decode_list(self, data: Union[bytes, str], pos: Optional[int] = 0) -> Tuple[list, int]:
         '''
@@ -99,39 +259,9 @@ Decodes bencode list to python list.
     Returns a tuple of python list and ending index of list in the data.
         '''
         if not isinstance(data, (bytes, str)):
-            raise DecodeListError(f'Expected bytes or str, got {type(data)}')
-        data = data.decode() if not isinstance(data, bytes) else data
-        if data[pos] != ord('l'):
-            raise exceptions.DecodeListError(f'Start of list not found, at position {pos}')
-        current_pos = pos + 1
-        contents = []
-        while current_pos < len(data):
-            if data[current_pos] == ord('i'):
-                integer, end = self.decode_integer(data, current_pos)
-                contents.append(integer)
-                current_pos = end + 1
-                continue
-            if ord('0') <= data[current_pos] <= ord('9'):
-                string, end = self.decode_string(data, current_pos)
-                contents.append(string)
-                current_pos = end + 1
-                continue
-            if data[current_pos] == ord('l'):
-                _list, end = self.decode_list(data, current_pos)
-                contents.append(_list)
-                current_pos = end + 1
-                continue
-            if data[current_pos] == ord('d'):
-                dictionary, end = self.decode_dictionary(data, current_pos)
-                contents.append(dictionary)
-                current_pos = end + 1
-                continue
-            if data[current_pos] == ord('e'):
-                break
-            raise exceptions.DecodeListError(f'Invalid data type in list, at position {current_pos}')
-        else:
-            raise exceptions.DecodeListError(f'End of list not found, from position {pos}')
-        return contents, current_pos
+            raise exceptions.DecodeListError(f'Expected bytes or str, got {type(data)}')
+        data = _latin1(data, exceptions.DecodeListError) if isinstance(data, str) else data
+        return _decode_list(data, pos)
 
     def decode_dictionary(self, data: Union[bytes, str], pos: Optional[int] = 0) -> Tuple[dict, int]:
         '''
@@ -155,41 +285,9 @@ Decodes bencode dict to python dict.
 
         '''
         if not isinstance(data, (bytes, str)):
-            raise DecodeDictionaryError(f'Expected bytes or str, got {type(data)}')
-        data = data.decode() if not isinstance(data, bytes) else data
-        if data[pos] != ord('d'):
-            raise exceptions.DecodeListError(f'Start of dictionary not found, at position {pos}')
-        current_pos = pos + 1
-        result = {}
-        while current_pos < len(data):
-            if data[current_pos] == ord('e'):
-                break
-            key, end = self.decode_string(data, current_pos)
-            current_pos = end + 1
-            if data[current_pos] == ord('i'):
-                integer, end = self.decode_integer(data, current_pos)
-                result[key] = integer
-                current_pos = end + 1
-                continue
-            if ord('0') <= data[current_pos] <= ord('9'):
-                string, end = self.decode_string(data, current_pos)
-                result[key] = string
-                current_pos = end + 1
-                continue
-            if data[current_pos] == ord('l'):
-                _list, end = self.decode_list(data, current_pos)
-                result[key] = _list
-                current_pos = end + 1
-                continue
-            if data[current_pos] == ord('d'):
-                dictionary, end = self.decode_dictionary(data, current_pos)
-                result[key] = dictionary
-                current_pos = end + 1
-                continue
-            raise exceptions.DecodeDictionaryError(f'Invalid dictionary value, at position {current_pos}')
-        else:
-            raise exceptions.DecodeDictionaryError(f'End of dictionary not found, from position {pos}')
-        return result, current_pos
+            raise exceptions.DecodeDictionaryError(f'Expected bytes or str, got {type(data)}')
+        data = _latin1(data, exceptions.DecodeDictionaryError) if isinstance(data, str) else data
+        return _decode_dictionary(data, pos)
 
     def decode(self, data: Union[bytes, str], pos: Optional[int] = 0) -> Union[bytes, int, list, dict]:
         '''
@@ -214,17 +312,25 @@ Decodes bencode data types to python data types.
 - Returns:
     Returns bytes of Python int, str, list, and dict objects to their corresponding Bencode representations.
         '''
+        # Coerce once at the boundary; the _decode_* internals only ever see
+        # bytes. latin-1 maps code points 0-255 straight to bytes, so binary
+        # payload data passed as str survives, unlike the UTF-8 default.
         if not isinstance(data, bytes):
-            data = data.encode()
-        if data[pos] == ord('i'):
-            integer, end = self.decode_integer(data, pos)
-            return integer
-        if ord('0') <= data[pos] <= ord('9'):
-            string, end = self.decode_string(data, pos)
-            return string
-        if data[pos] == ord('l'):
-            _list, end = self.decode_list(data, pos)
-            return _list
-        if data[pos] == ord('d'):
-            dictionary, end = self.decode_dictionary(data, pos)
-            return dictionary
\ No newline at end of file
+            data = _latin1(data, exceptions.DecodeStringError)
+        # Fastest available implementation first; both accelerators return
+        # their INVALID sentinel instead of raising, so malformed input
+        # falls through and the pure-Python decoder reports the documented
+        # exception for it.
+        if _cbencode is not None and pos == 0:
+            value = _cbencode.decode(data)
+            if value is not _cbencode.INVALID:
+                return value
+        elif _fast is not None and pos == 0 and len(data) >= _fast.MIN_FAST_SIZE:
+            value = _fast.decode(data)
+            if value is not _fast.INVALID:
+                return value
+        decoder = _DISPATCH[data[pos]]
+        if decoder is None:
+            return None
+        value, end = decoder(data, pos)
+        return value
@@ -1,7 +1,154 @@
+import functools
+import operator
 from typing import Union
 from . import exceptions
 
+# Precomputed encodings for the small values that dominate real payloads
+# (dict counts, lengths, piece sizes), so the hot paths skip the
+# format-then-encode round trip entirely.
+_INT_CACHE = [b'i%de' % i for i in range(-256, 4096)]
+_LEN_CACHE = [f'{i}:'.encode() for i in range(4096)]
+
+# Like the decoder, the working code lives in module-level functions. They
+# all write into one shared bytearray, which grows geometrically, so a
+# whole nested structure is encoded with a single output buffer instead of
+# one intermediate bytes object per node. The Encoder class below is a
+# thin facade that validates input and delegates here.
+
+# All writers share the (buf, data, sort_keys) signature so the dispatch
+# table can call any of them uniformly; the leaf writers ignore the flag.
+
+def _encode_integer_into(buf: bytearray, data: int, sort_keys: bool = True) -> None:
+    if -256 <= data < 4096:
+        buf += _INT_CACHE[data + 256]
+    else:
+        # bytes %-formatting writes the digits straight into a bytes
+        # object with no intermediate str or re-encode.
+        buf += b'i%de' % data
+
+def _latin1(data: str) -> bytes:
+    '''
+Coerces str input to the bytes it represents. latin-1 only maps code
+points 0-255, so anything above that raises EncodeStringError like
+every other unencodable input instead of a bare UnicodeEncodeError.
+    '''
+    try:
+        return data.encode('latin-1')
+    except UnicodeEncodeError as error:
+        raise exceptions.EncodeStringError(f'Expected str with code points <= 255, got {error.object[error.start]!r} at index {error.start}') from error
+
+@functools.lru_cache(maxsize=1024)
+def _encode_string_cached(data: Union[bytes, str]) -> bytes:
+    '''
+Memoized encoding for short strings. Bencode payloads repeat the same
+dict keys (b'path', b'length', ...) thousands of times, so after the
+first encode each repeat is a single cache hit.
+    '''
+    if not isinstance(data, bytes):
+        data = _latin1(data)
+    length = len(data)
+    prefix = _LEN_CACHE[length] if length < 4096 else b'%d:' % length
+    return prefix + data
+
+def _encode_string_into(buf: bytearray, data: Union[bytes, str], sort_keys: bool = True) -> None:
+    if len(data) <= 64:
+        buf += _encode_string_cached(data)
+        return
+    if not isinstance(data, bytes):
+        data = _latin1(data)
+    length = len(data)
+    buf += _LEN_CACHE[length] if length < 4096 else b'%d:' % length
+    buf += data
+
+def _encode_list_into(buf: bytearray, data: list, sort_keys: bool = True) -> None:
+    # Large lists are in principle data-parallel (each element encodes to
+    # an independent fragment, joinable at the end), but all encoding here
+    # runs under the GIL, so farming elements out to a thread pool only
+    # adds overhead. Revisit if a GIL-releasing native encoder is added to
+    # match the C decode path.
+    buf += b'l'
+    dispatch = _DISPATCH
+    for item in data:
+        encoder = dispatch.get(type(item)) or _slow_dispatch(item)
+        if encoder is None:
+            continue
+        encoder(buf, item, sort_keys)
+    buf += b'e'
+
+_itemgetter0 = operator.itemgetter(0)
+
+def _bytes_key(pair):
+    '''
+Sort key that normalizes str keys to the bytes they encode as; used when
+the keys are a mix of str and bytes. latin-1 byte order matches code
+point order, so all-str dicts can sort directly on the keys instead.
+    '''
+    key = pair[0]
+    if isinstance(key, str):
+        return _latin1(key)
+    if isinstance(key, bytes):
+        return key
+    raise exceptions.EncodeDictionaryError(f'Expected dict key type str or byte, got {type(key)}')
+
+def _encode_dictionary_into(buf: bytearray, data: dict, sort_keys: bool = True) -> None:
+    if sort_keys:
+        # The spec requires keys in raw-byte order. itemgetter is
+        # C-implemented and works whenever the keys are one type; mixed
+        # str/bytes keys raise TypeError and take the normalizing path.
+        try:
+            items = sorted(data.items(), key=_itemgetter0)
+        except TypeError:
+            items = sorted(data.items(), key=_bytes_key)
+    else:
+        items = data.items()
+    buf += b'd'
+    dispatch = _DISPATCH
+    for key, value in items:
+        if isinstance(key, (str, bytes)):
+            _encode_string_into(buf, key)
+        else:
+            raise exceptions.EncodeDictionaryError(f'Expected dict key type str or byte, got {type(key)}')
+        encoder = dispatch.get(type(value)) or _slow_dispatch(value)
+        if encoder is None:
+            raise exceptions.EncodeDictionaryError(f'Expected type int, str, list or dict, got {type(value)}')
+        encoder(buf, value, sort_keys)
+    buf += b'e'
+
+# Exact-type dispatch table: type(item) plus one dict lookup is cheaper
+# than a chain of isinstance calls. Subclasses miss here and are resolved
+# by _slow_dispatch.
+_DISPATCH = {
+    int: _encode_integer_into,
+    str: _encode_string_into,
+    bytes: _encode_string_into,
+    list: _encode_list_into,
+    dict: _encode_dictionary_into,
+}
+
+def _slow_dispatch(item):
+    '''
+Resolves the encoder for subclasses of the supported types.
+Returns None if the type is not encodable.
+    '''
+    # Class patterns compile to MATCH_CLASS, which the adaptive
+    # interpreter specializes past the Python-level isinstance calls.
+    match item:
+        case int():
+            return _encode_integer_into
+        case str() | bytes():
+            return _encode_string_into
+        case list():
+            return _encode_list_into
+        case dict():
+            return _encode_dictionary_into
+        case _:
+            return None
+
 class Encoder:
+    # Stateless facade: no instance dict needed, so instances stay one
+    # small allocation and attribute lookups skip the __dict__ probe.
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -24,9 +171,9 @@ Encodes a python integer to bencode integer.
         '''
         if not isinstance(data, int):
             raise exceptions.EncodeIntegerError(f'Expected int, got {type(data)}')
-        integer = f'i{data}e'
-        result = integer.encode()
-        return result
+        if -256 <= data < 4096:
+            return _INT_CACHE[data + 256]
+        return b'i%de' % data
 
     def encode_string(self, data: Union[bytes, str]) -> bytes:
         '''
@@ -48,9 +195,15 @@ Encodes a python string or python bytes to bencode string.
         '''
         if not isinstance(data, (str, bytes)):
             raise exceptions.EncodeStringError(f'Expected str or byte, got {type(data)}')
-        data = data.encode() if not isinstance(data, bytes) else data
-        length = str(len(data)).encode()
-        result = length + b':' + data
+        if len(data) <= 64:
+            return _encode_string_cached(data)
+        # latin-1 maps code points 0-255 one-to-one onto bytes (a straight
+        # memcpy in CPython), mirroring the decode boundary: str input is
+        # treated as a byte string, not re-encoded as multi-byte UTF-8.
+        data = _latin1(data) if not isinstance(data, bytes) else data
+        length = len(data)
+        prefix = _LEN_CACHE[length] if length < 4096 else b'%d:' % length
+        result = prefix + data
         return result
 
     def encode_list(self, data: list) -> bytes:
@@ -73,28 +226,11 @@ Encodes a python list to bencode list.
         '''
         if not isinstance(data, list):
             raise exceptions.EncodeListError(f'Expected list, got {type(data)}')
-        result = b'l'
-        for item in data:
-            if isinstance(item, int):
-                integer = self.encode_integer(item)
-                result += integer
-                continue
-            if isinstance(item, (str, bytes)):
-                string = self.encode_string(item)
-                result += string
-                continue
-            if isinstance(item, list):
-                _list = self.encode_list(item)
-                result += _list
-                continue
-            if isinstance(item, dict):
-                dictionary = self.encode_dictionary(item)
-                result += dictionary
-                continue
-        result += b'e'
-        return result
+        buf = bytearray()
+        _encode_list_into(buf, data)
+        return bytes(buf)
 
-    def encode_dictionary(self, data: dict) -> bytes:
+    def encode_dictionary(self, data: dict, sort_keys: bool = True) -> bytes:
         '''
 Encodes a python dict to bencode dict.
 
@@ -112,34 +248,17 @@ Encodes a python dict to bencode dict.
 
 - Returns:
     Returns converted python dict to bencode dict in bytes.
+    Keys are emitted in sorted raw-byte order as the bencode spec
+    requires; pass sort_keys=False to keep insertion order when the
+    dict is known to be sorted already.
         '''
         if not isinstance(data, dict):
             raise exceptions.EncodeListError(f'Expected dict, got {type(data)}')
-        result = b'd'
-        for key, value in data.items():
-            if isinstance(key, (str, bytes)):
-                string = self.encode_string(key)
-                result += string
-            else:
-                raise exceptions.EncodeDictionaryError(f'Expected dict key type str or byte, got {type(key)}')
-            if isinstance(value, (str, bytes)):
-                string = self.encode_string(value)
-                result += string
-            elif isinstance(value, int):
-                integer = self.encode_integer(value)
-                result += integer
-            elif isinstance(value, list):
-                _list = self.encode_list(value)
-                result += _list
-            elif isinstance(value, dict):
-                dictionary = self.encode_dictionary(value)
-                result += dictionary
-            else:
-                raise exceptions.EncodeDictionaryError(f'Expected type int, str, list or dict, got {type(value)}')
-        result += b'e'
-        return result
+        buf = bytearray()
+        _encode_dictionary_into(buf, data, sort_keys)
+        return bytes(buf)
 
-    def encode(self, data: Union[bytes, str, int, list, dict]) -> Union[bytes, str, int, list, dict]:
+    def encode(self, data: Union[bytes, str, int, list, dict], sort_keys: bool = True) -> Union[bytes, str, int, list, dict]:
         '''
 Encodes Returns bytes of bencode int, str, list and dict objects to their corresponding Python representations.
 
@@ -166,12 +285,13 @@ Encodes Returns bytes of bencode int, str, list and dict objects to their corres
 - Returns:
     Returns bytes of bencode int, str, list and dict objects to their corresponding Python representations.
         '''
-        if isinstance(data, (str, bytes)):
-            return self.encode_string(data)
-        elif isinstance(data, int):
-            return self.encode_integer(data)
-        elif isinstance(data, list):
-            return self.encode_list(data)
-        elif isinstance(data, dict):
-            return self.encode_dictionary(data)
-        raise exceptions.EncodeError(f'Expected type int, str, list or dict, got {type(data)}')
\ No newline at end of file
+        # Single type resolution at the boundary; the _encode_*_into
+        # workers assume their input type and never re-validate, so the
+        # isinstance chain here and the re-check in the encode_* methods
+        # are both skipped.
+        encoder = _DISPATCH.get(type(data)) or _slow_dispatch(data)
+        if encoder is None:
+            raise exceptions.EncodeError(f'Expected type int, str, list or dict, got {type(data)}')
+        buf = bytearray()
+        encoder(buf, data, sort_keys)
+        return bytes(buf)
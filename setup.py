@@ -1,4 +1,4 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 
 setup(
     name='bencode',
@@ -6,5 +6,14 @@ setup(
     author='Sasta Dev',
     description='A python package to encode and decode bencode.',
     license='MIT',
-    packages=find_packages()
+    packages=find_packages(),
+    python_requires='>=3.10',
+    # optional=True: the package falls back to the pure-Python decoder
+    # when no C compiler is available.
+    ext_modules=[
+        Extension('bencode._cbencode', ['bencode/_cbencode.c'], optional=True)
+    ],
+    extras_require={
+        'fast': ['numba', 'numpy']
+    }
 )
\ No newline at end of file